@@ -0,0 +1,40 @@
+"""Add covering index for the GET /api/todos query pattern
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-09-01 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index matching WHERE user_id = ? ORDER BY id DESC, with the
+    # remaining columns INCLUDEd so the list endpoint is an index-only scan
+    # (no heap fetches, no sort step).
+    op.create_index(
+        'ix_todo_items_user_id_id_desc',
+        'todo_items',
+        ['user_id', sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['text', 'completed', 'created_at', 'updated_at'],
+    )
+
+    # The (user_id, completed) index has no hot query path and only adds
+    # write amplification now that the covering index exists.
+    op.drop_index('ix_todo_items_user_completed', table_name='todo_items')
+
+
+def downgrade() -> None:
+    op.create_index('ix_todo_items_user_completed', 'todo_items', ['user_id', 'completed'], unique=False)
+    op.drop_index('ix_todo_items_user_id_id_desc', table_name='todo_items')
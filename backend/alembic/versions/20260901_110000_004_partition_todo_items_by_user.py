@@ -0,0 +1,113 @@
+"""Hash-partition todo_items by user_id
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-09-01 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+N_PARTITIONS = 16
+
+
+def upgrade() -> None:
+    # Declarative partitioning is PostgreSQL-only; other backends (e.g. the
+    # SQLite test database) keep the plain heap table.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('ALTER TABLE todo_items RENAME TO todo_items_unpartitioned')
+
+    # Partitioned tables require the partition key in every unique
+    # constraint, so the primary key becomes (user_id, id). Clustering each
+    # user's rows onto a few partitions shrinks the working set per query.
+    op.execute("""
+        CREATE TABLE todo_items (
+            id BIGINT GENERATED BY DEFAULT AS IDENTITY,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            text VARCHAR(500) NOT NULL,
+            completed BOOLEAN NOT NULL DEFAULT false,
+            created_at TIMESTAMPTZ DEFAULT now(),
+            updated_at TIMESTAMPTZ,
+            PRIMARY KEY (user_id, id)
+        ) PARTITION BY HASH (user_id)
+    """)
+    for i in range(N_PARTITIONS):
+        op.execute(
+            f'CREATE TABLE todo_items_p{i} PARTITION OF todo_items '
+            f'FOR VALUES WITH (MODULUS {N_PARTITIONS}, REMAINDER {i})'
+        )
+
+    # Recreate the covering index from revision 003 on the partitioned parent
+    op.create_index(
+        'ix_todo_items_user_id_id_desc',
+        'todo_items',
+        ['user_id', sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['text', 'completed', 'created_at', 'updated_at'],
+    )
+
+    op.execute("""
+        INSERT INTO todo_items (id, user_id, text, completed, created_at, updated_at)
+        SELECT id, user_id, text, completed, created_at, updated_at
+        FROM todo_items_unpartitioned
+    """)
+    op.execute("""
+        SELECT setval(
+            pg_get_serial_sequence('todo_items', 'id'),
+            COALESCE((SELECT MAX(id) FROM todo_items), 1)
+        )
+    """)
+
+    op.execute('DROP TABLE todo_items_unpartitioned')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('ALTER TABLE todo_items RENAME TO todo_items_partitioned')
+
+    op.execute("""
+        CREATE TABLE todo_items (
+            id SERIAL PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            text VARCHAR(500) NOT NULL,
+            completed BOOLEAN NOT NULL DEFAULT false,
+            created_at TIMESTAMPTZ DEFAULT now(),
+            updated_at TIMESTAMPTZ
+        )
+    """)
+    op.create_index(
+        'ix_todo_items_user_id_id_desc',
+        'todo_items',
+        ['user_id', sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['text', 'completed', 'created_at', 'updated_at'],
+    )
+    op.create_index('ix_todo_items_id', 'todo_items', ['id'], unique=False)
+    op.create_index('ix_todo_items_user_id', 'todo_items', ['user_id'], unique=False)
+
+    op.execute("""
+        INSERT INTO todo_items (id, user_id, text, completed, created_at, updated_at)
+        SELECT id, user_id, text, completed, created_at, updated_at
+        FROM todo_items_partitioned
+    """)
+    op.execute("""
+        SELECT setval(
+            pg_get_serial_sequence('todo_items', 'id'),
+            COALESCE((SELECT MAX(id) FROM todo_items), 1)
+        )
+    """)
+
+    op.execute('DROP TABLE todo_items_partitioned')
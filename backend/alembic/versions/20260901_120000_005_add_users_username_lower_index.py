@@ -0,0 +1,35 @@
+"""Add functional lower(username) index for case-insensitive login
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-09-01 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Login compares lower(username) in SQL; this keeps that lookup an
+    # index hit even if stored case ever drifts from the registration-time
+    # normalization. The plain unique constraint on username stays as the
+    # storage-level guarantee.
+    op.create_index(
+        'ix_users_username_lower',
+        'users',
+        [sa.text('lower(username)')],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_username_lower', table_name='users')
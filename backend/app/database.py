@@ -1,57 +1,71 @@
 """
 Database configuration and session management.
-Uses SQLAlchemy for ORM with PostgreSQL.
+Uses async SQLAlchemy for ORM with PostgreSQL (asyncpg driver).
 """
 import logging
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Create SQLAlchemy engine
-engine = create_engine(
+# asyncpg-only connection options. The app runs a small, fixed set of hot
+# statements, so a generous prepared-statement cache skips parse/plan on
+# every execution. Set to 0 behind PgBouncer in transaction mode, where
+# server-side prepared statements break.
+_connect_args = {}
+if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    _connect_args["prepared_statement_cache_size"] = 256
+
+# Create async SQLAlchemy engine
+engine = create_async_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before using them
-    pool_size=5,  # Maximum number of connections to keep in the pool
-    max_overflow=10,  # Maximum number of connections to create beyond pool_size
+    pool_size=settings.DB_POOL_SIZE,  # Maximum number of connections to keep in the pool
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Maximum number of connections to create beyond pool_size
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # Seconds to wait for a free connection before erroring
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle connections older than this (seconds)
+    connect_args=_connect_args,
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory. expire_on_commit=False so ORM instances stay
+# usable after commit without triggering implicit IO in the async session.
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
-# Create base class for declarative models
-Base = declarative_base()
+# Create base class for declarative models. MappedAsDataclass gives the
+# models generated dataclass __init__ methods, which hydrate rows faster
+# than the legacy kwargs constructor.
+class Base(MappedAsDataclass, DeclarativeBase):
+    pass
 
 
-def get_db():
+async def get_db():
     """
     Database session dependency for FastAPI.
-    Yields a database session and ensures it is closed after use.
-    
+    Yields an async database session and ensures it is closed after use.
+
     Usage:
         @app.get("/items")
-        def get_items(db: Session = Depends(get_db)):
-            return db.query(Item).all()
+        async def get_items(db: AsyncSession = Depends(get_db)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def check_database_connection() -> bool:
+async def check_database_connection() -> bool:
     """
     Check if database connection is working.
     Returns True if connection is successful, False otherwise.
     """
     try:
-        db = SessionLocal()
-        db.execute("SELECT 1")
-        db.close()
+        # A bare connection is enough for a ping; no need to build a
+        # Session and its identity map.
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
         logger.info("Database connection successful")
         return True
     except Exception as e:
@@ -1,15 +1,17 @@
 """
 Main FastAPI application entry point.
 """
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import text
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.database import SessionLocal
+from app.database import check_database_connection
 from app.routers import auth_router, todos_router
 
 # Configure logging
@@ -34,7 +36,9 @@ app = FastAPI(
     title="To-Do App API",
     description="A simple to-do list application API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes datetime-heavy model lists far faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -61,11 +65,20 @@ def root():
     }
 
 
+# Cache the DB probe result so frequent orchestrator probes (K8s, App
+# Service) don't each cost a database round-trip. The probe itself is
+# capped at 1s so a hung database can't stall the endpoint.
+_HEALTH_PROBE_TTL = 10.0  # seconds
+_HEALTH_PROBE_TIMEOUT = 1.0  # seconds
+_health_cache = {"ts": 0.0, "db": "unknown"}
+
+
 @app.get("/health")
-def health_check():
+async def health_check():
     """
     Health check endpoint for monitoring.
     Returns status of API and database connectivity.
+    The database probe result is cached for a few seconds.
     """
     health_status = {
         "status": "healthy",
@@ -74,16 +87,23 @@ def health_check():
             "database": "unknown"
         }
     }
-    
-    # Check database connectivity
-    try:
-        db = SessionLocal()
-        db.execute(text("SELECT 1"))
-        db.close()
-        health_status["components"]["database"] = "healthy"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        health_status["components"]["database"] = "unhealthy"
+
+    # Check database connectivity, reusing a recent probe result if available
+    db_status = _health_cache["db"]
+    if db_status == "unknown" or time.monotonic() - _health_cache["ts"] >= _HEALTH_PROBE_TTL:
+        try:
+            reachable = await asyncio.wait_for(
+                check_database_connection(), timeout=_HEALTH_PROBE_TIMEOUT
+            )
+            db_status = "healthy" if reachable else "unhealthy"
+        except asyncio.TimeoutError:
+            logger.error("Database health check timed out after %ss", _HEALTH_PROBE_TIMEOUT)
+            db_status = "unhealthy"
+        _health_cache["ts"] = time.monotonic()
+        _health_cache["db"] = db_status
+
+    health_status["components"]["database"] = db_status
+    if db_status != "healthy":
         health_status["status"] = "degraded"
-    
+
     return health_status
@@ -1,9 +1,12 @@
 """
 SQLAlchemy model for to-do items.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, String
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
@@ -11,7 +14,7 @@ from app.database import Base
 class TodoItem(Base):
     """
     To-do item model.
-    
+
     Attributes:
         id: Primary key
         user_id: Foreign key to users table (owner of the item)
@@ -21,21 +24,31 @@ class TodoItem(Base):
         updated_at: Timestamp when the item was last updated
     """
     __tablename__ = "todo_items"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
-        Integer, 
-        ForeignKey("users.id", ondelete="CASCADE"), 
-        nullable=False, 
-        index=True
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True, default=None)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        index=True,
+        default=None,
+    )
+    text: Mapped[str] = mapped_column(String(500), default=None)
+    completed: Mapped[bool] = mapped_column(default=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), default=None
     )
-    text = Column(String(500), nullable=False)
-    completed = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
-    # Relationship to User model
-    owner = relationship("User", back_populates="todo_items")
-    
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now(), default=None
+    )
+
+    # Relationship to User model. lazy="raise" turns accidental per-row
+    # lazy loads (the N+1 pattern) into an immediate error; eager-load
+    # explicitly with joinedload/selectinload where owner data is needed.
+    owner: Mapped["User"] = relationship(
+        back_populates="todo_items",
+        lazy="raise",
+        init=False,
+        repr=False,
+    )
+
     def __repr__(self):
         return f"<TodoItem(id={self.id}, user_id={self.user_id}, completed={self.completed})>"
@@ -1,9 +1,12 @@
 """
 SQLAlchemy model for users.
 """
-from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import DateTime, String
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
@@ -11,7 +14,7 @@ from app.database import Base
 class User(Base):
     """
     User model for authentication and authorization.
-    
+
     Attributes:
         id: Primary key
         username: Unique username (max 50 chars, stored lowercase)
@@ -20,19 +23,30 @@ class User(Base):
         updated_at: Timestamp when the user was last updated
     """
     __tablename__ = "users"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String(50), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
-    # Relationship to TodoItem model (one-to-many)
-    todo_items = relationship(
-        "TodoItem", 
-        back_populates="owner", 
-        cascade="all, delete-orphan"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True, default=None)
+    username: Mapped[str] = mapped_column(String(50), unique=True, index=True, default=None)
+    password_hash: Mapped[str] = mapped_column(String(255), default=None)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), default=None
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now(), default=None
     )
-    
+
+    # Relationship to TodoItem model (one-to-many). lazy="raise" turns
+    # accidental per-row lazy loads (the N+1 pattern) into an immediate
+    # error; eager-load explicitly with selectinload where needed.
+    # passive_deletes defers cascading to the FK's ON DELETE CASCADE
+    # instead of loading the collection just to delete it.
+    todo_items: Mapped[List["TodoItem"]] = relationship(
+        back_populates="owner",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
+        init=False,
+        repr=False,
+    )
+
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username})>"
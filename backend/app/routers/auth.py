@@ -3,23 +3,44 @@ Authentication router for user registration, login, and user info endpoints.
 """
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse
 from app.schemas.auth import LoginRequest, LoginResponse, LoginUserInfo
-from app.utils.security import hash_password, verify_password, create_access_token
-from app.utils.auth import get_current_user
+from app.utils.security import (
+    hash_password,
+    verify_password,
+    verify_and_update_password,
+    create_access_token,
+)
+from app.utils.auth import get_current_user, _invalidate_user
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+# Shared 401 for failed logins; Starlette only reads attributes off the
+# raised exception, so one instance per process is safe
+_INVALID_CREDENTIALS = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+# Precomputed once at import: compared against on the "user not found" path so
+# a miss costs the same bcrypt verify as a wrong password, closing the timing
+# side channel without hashing a fresh dummy password on every failed login.
+_DUMMY_HASH = hash_password("dummy_password_for_timing")
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Register a new user.
     
@@ -29,43 +50,39 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     Returns the created user (without password).
     """
     # Log registration attempt (never log password)
-    logger.info(f"Registration attempt for username: {user_data.username}")
-    
-    # Check if username already exists
-    existing_user = db.query(User).filter(User.username == user_data.username).first()
-    if existing_user:
-        logger.warning(f"Registration failed: username '{user_data.username}' already exists")
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Username already exists"
-        )
-    
+    logger.debug("Registration attempt for username: %s", user_data.username)
+
     # Hash the password
     password_hash = hash_password(user_data.password)
-    
-    # Create new user
-    new_user = User(
-        username=user_data.username,
-        password_hash=password_hash
+
+    # Insert in a single round-trip: ON CONFLICT DO NOTHING means a taken
+    # username simply returns no row, with no separate existence check and
+    # no race window between check and insert.
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = (
+        insert(User)
+        .values(username=user_data.username, password_hash=password_hash)
+        .on_conflict_do_nothing(index_elements=["username"])
+        .returning(User)
     )
-    
-    try:
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-        logger.info(f"User registered successfully: {new_user.username} (id: {new_user.id})")
-        return new_user
-    except IntegrityError as e:
-        db.rollback()
-        logger.error(f"Database error during registration: {e}")
+    result = await db.execute(stmt)
+    new_user = result.scalar_one_or_none()
+
+    if new_user is None:
+        await db.rollback()
+        logger.warning("Registration failed: username '%s' already exists", user_data.username)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Username already exists"
         )
 
+    await db.commit()
+    logger.info("User registered successfully: %s (id: %s)", new_user.username, new_user.id)
+    return new_user
+
 
 @router.post("/login", response_model=LoginResponse)
-def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
     """
     Authenticate a user and return a JWT access token.
     
@@ -75,39 +92,48 @@ def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     Returns an access token and user information on success.
     """
     # Log login attempt (never log password)
-    logger.info(f"Login attempt for username: {login_data.username}")
+    logger.debug("Login attempt for username: %s", login_data.username)
     
     # Normalize username to lowercase for case-insensitive lookup
     username = login_data.username.lower()
-    
-    # Look up user by username
-    user = db.query(User).filter(User.username == username).first()
-    
-    # Use generic error message to prevent username enumeration
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    # Check if user exists
+
+    # Compare lower(username) in SQL so the lookup stays correct even if
+    # stored case drifts; served by the functional index from migration 005
+    result = await db.execute(select(User).where(func.lower(User.username) == username))
+    user = result.scalar_one_or_none()
+    
+    # Check if user exists; burn an equivalent bcrypt verify so the miss
+    # path is not measurably faster than a wrong-password attempt. The
+    # generic error message prevents username enumeration.
     if not user:
-        logger.warning(f"Login failed: username '{username}' not found")
-        raise credentials_exception
-    
-    # Verify password
-    if not verify_password(login_data.password, user.password_hash):
-        logger.warning(f"Login failed: invalid password for username '{username}'")
-        raise credentials_exception
-    
-    # Generate JWT token
+        verify_password(login_data.password, _DUMMY_HASH)
+        logger.warning("Login failed: username '%s' not found", username)
+        raise _INVALID_CREDENTIALS
+    
+    # Verify password; a legacy-scheme hash yields a replacement to store
+    valid, upgraded_hash = verify_and_update_password(login_data.password, user.password_hash)
+    if not valid:
+        logger.warning("Login failed: invalid password for username '%s'", username)
+        raise _INVALID_CREDENTIALS
+
+    if upgraded_hash is not None:
+        # Opportunistically migrate pre-SHA-256-prehash hashes on login
+        await db.execute(
+            update(User).where(User.id == user.id).values(password_hash=upgraded_hash)
+        )
+        await db.commit()
+        _invalidate_user(user.id)
+        logger.info("Password hash upgraded for user_id: %s", user.id)
+
+    # Generate JWT token. sub is encoded as an int (the JWT spec allows
+    # any JSON value) so validation skips a str -> int parse per request.
     token_data = {
-        "sub": str(user.id),
+        "sub": user.id,
         "username": user.username
     }
     access_token = create_access_token(data=token_data)
     
-    logger.info(f"Login successful for user_id: {user.id}")
+    logger.info("Login successful for user_id: %s", user.id)
     
     return LoginResponse(
         access_token=access_token,
@@ -125,5 +151,13 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
     
     Returns the authenticated user's data (without password).
     """
-    logger.info(f"User info requested for user_id: {current_user.id}")
-    return current_user
+    logger.debug("User info requested for user_id: %s", current_user.id)
+    # Hand back a Response directly: with the auth caches in place the
+    # Pydantic validation/serialization pass would dominate this endpoint,
+    # and orjson encodes the dict (datetime included) straight from C.
+    # response_model stays declared above so the OpenAPI schema is unchanged.
+    return ORJSONResponse({
+        "id": current_user.id,
+        "username": current_user.username,
+        "created_at": current_user.created_at,
+    })
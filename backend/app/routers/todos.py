@@ -3,27 +3,87 @@ To-do items router for CRUD operations.
 All endpoints require authentication and enforce user ownership.
 """
 import logging
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User
 from app.models.todo_item import TodoItem
-from app.schemas.todo_item import TodoItemCreate, TodoItemUpdateCompletion, TodoItemResponse
+from app.schemas.todo_item import (
+    TodoItemCreate,
+    TodoItemBulkCreate,
+    TodoItemUpdateCompletion,
+    TodoItemResponse,
+    TodoItemListResponse,
+)
 from app.utils.auth import get_current_user
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/todos", tags=["todos"])
 
+# Statements for the hot CRUD paths, built once at import time so the
+# expression-tree construction cost is amortized across requests.
+_CREATE_TODO = (
+    insert(TodoItem)
+    .values(user_id=bindparam("uid"), text=bindparam("text"), completed=False)
+    .returning(TodoItem)
+)
+_GET_TODOS = (
+    select(TodoItem)
+    .where(TodoItem.user_id == bindparam("uid"))
+    .order_by(TodoItem.id.desc())
+    .limit(bindparam("limit"))
+)
+_GET_TODOS_BEFORE_CURSOR = (
+    select(TodoItem)
+    .where(TodoItem.user_id == bindparam("uid"), TodoItem.id < bindparam("cursor"))
+    .order_by(TodoItem.id.desc())
+    .limit(bindparam("limit"))
+)
+_UPDATE_TODO = (
+    update(TodoItem)
+    .where(TodoItem.id == bindparam("todo_id"), TodoItem.user_id == bindparam("uid"))
+    .values(completed=bindparam("completed"))
+    .returning(TodoItem)
+)
+_DELETE_TODO = (
+    delete(TodoItem)
+    .where(TodoItem.id == bindparam("todo_id"), TodoItem.user_id == bindparam("uid"))
+    .returning(TodoItem.id)
+)
+
+
+async def _raise_missing_or_forbidden(db: AsyncSession, todo_id: int, user_id: int, action: str):
+    """
+    Raise 404 if the todo item doesn't exist, 403 if it belongs to another user.
+
+    Called after a single-statement UPDATE/DELETE matched no rows.
+    """
+    # Session.get() uses the ORM's precompiled PK-lookup path and can
+    # skip SQL entirely when the item is already in the identity map.
+    if await db.get(TodoItem, todo_id) is None:
+        logger.warning("Todo not found: id=%s", todo_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Todo item not found"
+        )
+
+    logger.warning("Authorization failed: user_id=%s tried to %s todo_id=%s", user_id, action, todo_id)
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Not authorized to {action} this item"
+    )
+
 
 @router.post("/", response_model=TodoItemResponse, status_code=status.HTTP_201_CREATED)
 async def create_todo_item(
     todo_data: TodoItemCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new to-do item for the authenticated user.
@@ -32,50 +92,96 @@ async def create_todo_item(
     
     Returns the created to-do item.
     """
-    logger.info(f"Creating todo for user_id: {current_user.id}")
-    
-    # Create new todo item
-    new_todo = TodoItem(
-        user_id=current_user.id,
-        text=todo_data.text.strip(),  # Remove leading/trailing whitespace
-        completed=False
+    logger.debug("Creating todo for user_id: %s", current_user.id)
+
+    # INSERT ... RETURNING hands back the row with its server-side
+    # defaults in one round-trip, so no post-commit refresh SELECT.
+    result = await db.execute(
+        _CREATE_TODO,
+        # Strip leading/trailing whitespace from the text
+        {"uid": current_user.id, "text": todo_data.text.strip()},
     )
+    new_todo = result.scalar_one()
+    await db.commit()
     
-    db.add(new_todo)
-    db.commit()
-    db.refresh(new_todo)
-    
-    logger.info(f"Todo created: id={new_todo.id} for user_id={current_user.id}")
+    logger.info("Todo created: id=%s for user_id=%s", new_todo.id, current_user.id)
     return new_todo
 
 
-@router.get("/", response_model=List[TodoItemResponse])
-async def get_all_todos(
+@router.post("/bulk", response_model=List[TodoItemResponse], status_code=status.HTTP_201_CREATED)
+async def create_todo_items_bulk(
+    bulk_data: TodoItemBulkCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Get all to-do items for the authenticated user.
-    
-    Returns items in reverse chronological order (newest first).
+    Create several to-do items for the authenticated user in one request.
+
+    - **items**: 1-500 to-do items, each with 1-500 characters of text
+
+    Returns the created items. All rows are written with a single
+    multi-VALUES INSERT - one round-trip and one transaction.
     """
-    logger.info(f"Fetching todos for user_id: {current_user.id}")
-    
-    todos = db.query(TodoItem)\
-              .filter(TodoItem.user_id == current_user.id)\
-              .order_by(TodoItem.id.desc())\
-              .all()
-    
-    logger.info(f"Returning {len(todos)} todos for user_id={current_user.id}")
+    user_id = current_user.id
+    logger.debug("Bulk-creating %s todos for user_id: %s", len(bulk_data.items), user_id)
+
+    stmt = (
+        insert(TodoItem)
+        .values([
+            {"user_id": user_id, "text": item.text.strip(), "completed": False}
+            for item in bulk_data.items
+        ])
+        .returning(TodoItem)
+    )
+    result = await db.execute(stmt)
+    todos = result.scalars().all()
+    await db.commit()
+
+    logger.info("Bulk-created %s todos for user_id=%s", len(todos), user_id)
     return todos
 
 
+@router.get("/", response_model=TodoItemListResponse)
+async def get_all_todos(
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of items per page"),
+    cursor: Optional[int] = Query(None, description="Return items with id below this value"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get a page of to-do items for the authenticated user.
+
+    - **limit**: page size, 1-200 (default 50)
+    - **cursor**: id of the last item from the previous page (keyset pagination)
+
+    Returns items in reverse chronological order (newest first), plus a
+    next_cursor to fetch the following page (null on the last page).
+    """
+    logger.debug("Fetching todos for user_id: %s", current_user.id)
+
+    if cursor is None:
+        result = await db.execute(_GET_TODOS, {"uid": current_user.id, "limit": limit})
+    else:
+        result = await db.execute(
+            _GET_TODOS_BEFORE_CURSOR,
+            {"uid": current_user.id, "cursor": cursor, "limit": limit},
+        )
+    todos = result.scalars().all()
+
+    # A short page means we ran out of rows; otherwise hand back the last
+    # id so the client can keyset into the next page.
+    next_cursor = todos[-1].id if len(todos) == limit else None
+
+    logger.debug("Returning %s todos for user_id=%s", len(todos), current_user.id)
+    return TodoItemListResponse(items=todos, next_cursor=next_cursor)
+
+
 @router.patch("/{todo_id}", response_model=TodoItemResponse)
 async def update_todo_completion(
     todo_id: int,
     update_data: TodoItemUpdateCompletion,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update the completion status of a to-do item.
@@ -86,33 +192,27 @@ async def update_todo_completion(
     
     Returns the updated to-do item.
     """
-    logger.info(f"Updating todo_id={todo_id} for user_id={current_user.id}")
-    
-    # Get the todo item
-    todo = db.query(TodoItem).filter(TodoItem.id == todo_id).first()
-    
-    # Check if todo exists
-    if not todo:
-        logger.warning(f"Todo not found: id={todo_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo item not found"
-        )
-    
-    # Check authorization (user owns this todo)
-    if todo.user_id != current_user.id:
-        logger.warning(f"Authorization failed: user_id={current_user.id} tried to update todo_id={todo_id}")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this item"
-        )
-    
-    # Update completion status
-    todo.completed = update_data.completed
-    db.commit()
-    db.refresh(todo)
-    
-    logger.info(f"Todo updated: id={todo_id}, completed={update_data.completed}")
+    # Capture the id up front: the rollback on the miss path expires
+    # current_user, and re-reading it would lazy-load in the async session.
+    user_id = current_user.id
+    logger.debug("Updating todo_id=%s for user_id=%s", todo_id, user_id)
+
+    # Update in a single round-trip, folding the ownership check into the
+    # WHERE clause. The 404 vs 403 disambiguation only costs an extra
+    # query on the miss path.
+    result = await db.execute(
+        _UPDATE_TODO,
+        {"todo_id": todo_id, "uid": user_id, "completed": update_data.completed},
+    )
+    todo = result.scalar_one_or_none()
+
+    if todo is None:
+        await db.rollback()
+        await _raise_missing_or_forbidden(db, todo_id, user_id, action="update")
+
+    await db.commit()
+
+    logger.info("Todo updated: id=%s, completed=%s", todo_id, update_data.completed)
     return todo
 
 
@@ -120,7 +220,7 @@ async def update_todo_completion(
 async def delete_todo_item(
     todo_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a to-do item permanently.
@@ -129,30 +229,24 @@ async def delete_todo_item(
     
     Returns 204 No Content on success.
     """
-    logger.info(f"Deleting todo_id={todo_id} for user_id={current_user.id}")
-    
-    # Get the todo item
-    todo = db.query(TodoItem).filter(TodoItem.id == todo_id).first()
-    
-    # Check if todo exists
-    if not todo:
-        logger.warning(f"Todo not found: id={todo_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo item not found"
-        )
-    
-    # Check authorization (user owns this todo)
-    if todo.user_id != current_user.id:
-        logger.warning(f"Authorization failed: user_id={current_user.id} tried to delete todo_id={todo_id}")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this item"
-        )
-    
-    # Delete the todo
-    db.delete(todo)
-    db.commit()
-    
-    logger.info(f"Todo deleted: id={todo_id}")
+    # Capture the id up front: the rollback on the miss path expires
+    # current_user, and re-reading it would lazy-load in the async session.
+    user_id = current_user.id
+    logger.debug("Deleting todo_id=%s for user_id=%s", todo_id, user_id)
+
+    # Delete in a single round-trip with the ownership check folded into
+    # the WHERE clause; disambiguate 404 vs 403 only when no row matched.
+    result = await db.execute(
+        _DELETE_TODO,
+        {"todo_id": todo_id, "uid": user_id},
+    )
+    deleted_id = result.scalar_one_or_none()
+
+    if deleted_id is None:
+        await db.rollback()
+        await _raise_missing_or_forbidden(db, todo_id, user_id, action="delete")
+
+    await db.commit()
+
+    logger.info("Todo deleted: id=%s", todo_id)
     return None
@@ -4,7 +4,13 @@ Schemas define the structure of API inputs and outputs.
 """
 from app.schemas.user import UserCreate, UserResponse, UserInDB
 from app.schemas.auth import LoginRequest, LoginResponse, LoginUserInfo
-from app.schemas.todo_item import TodoItemCreate, TodoItemUpdateCompletion, TodoItemResponse
+from app.schemas.todo_item import (
+    TodoItemCreate,
+    TodoItemBulkCreate,
+    TodoItemUpdateCompletion,
+    TodoItemResponse,
+    TodoItemListResponse,
+)
 
 __all__ = [
     "UserCreate", 
@@ -14,6 +20,8 @@ __all__ = [
     "LoginResponse",
     "LoginUserInfo",
     "TodoItemCreate",
+    "TodoItemBulkCreate",
     "TodoItemUpdateCompletion",
     "TodoItemResponse",
+    "TodoItemListResponse",
 ]
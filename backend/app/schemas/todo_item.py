@@ -2,7 +2,7 @@
 Pydantic schemas for to-do item requests and responses.
 """
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -14,6 +14,15 @@ class TodoItemCreate(BaseModel):
     text: str = Field(..., min_length=1, max_length=500, description="To-do item text")
 
 
+class TodoItemBulkCreate(BaseModel):
+    """
+    Schema for creating several to-do items in one request.
+    """
+    items: List[TodoItemCreate] = Field(
+        ..., min_length=1, max_length=500, description="To-do items to create (1-500)"
+    )
+
+
 class TodoItemUpdateCompletion(BaseModel):
     """
     Schema for updating to-do item completion status.
@@ -31,5 +40,15 @@ class TodoItemResponse(BaseModel):
     completed: bool
     created_at: datetime
     updated_at: Optional[datetime] = None
-    
+
     model_config = {"from_attributes": True}
+
+
+class TodoItemListResponse(BaseModel):
+    """
+    Schema for a keyset-paginated page of to-do items.
+    """
+    items: List[TodoItemResponse]
+    next_cursor: Optional[int] = Field(
+        None, description="Pass as 'cursor' to fetch the next page; null on the last page"
+    )
@@ -2,12 +2,18 @@
 Utility functions and helpers.
 Includes authentication utilities, validators, and common helpers.
 """
-from app.utils.security import hash_password, verify_password, create_access_token
+from app.utils.security import (
+    hash_password,
+    verify_password,
+    verify_and_update_password,
+    create_access_token,
+)
 from app.utils.auth import get_current_user, get_current_user_optional
 
 __all__ = [
-    "hash_password", 
-    "verify_password", 
+    "hash_password",
+    "verify_password",
+    "verify_and_update_password",
     "create_access_token",
     "get_current_user",
     "get_current_user_optional",
@@ -2,13 +2,17 @@
 Authentication dependencies for FastAPI route protection.
 Provides JWT token validation and user extraction.
 """
+import hashlib
 import logging
+import time
 from typing import Optional
 
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from jwt import InvalidTokenError as JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.database import get_db
@@ -20,10 +24,106 @@ logger = logging.getLogger(__name__)
 security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
+# Shared 401 raised on any validation failure. Starlette only reads
+# attributes off the exception, so one instance is safe to reuse and
+# saves an HTTPException + headers-dict allocation per rejected request.
+_CREDENTIALS_EXCEPTION = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+# Key material and algorithm list prepared once instead of per decode
+_JWT_KEY = settings.SECRET_KEY.encode("utf-8")
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+
+# Clients reuse the same bearer token for its whole lifetime, so cache
+# successful validations and skip the signature verify + JSON parse on
+# repeat requests. Keyed by a token digest so raw tokens stay out of
+# memory; only valid tokens are cached and expiry is re-checked on hit.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+
+def _decode_token_user_id(token: str) -> int:
+    """
+    Return the user id from a validated JWT, memoizing successful decodes.
+
+    Raises JWTError / ValueError / TypeError exactly as a direct
+    jwt.decode + int(sub) would, so callers keep their error handling.
+    """
+    # A JWT is always header.payload.signature; reject anything else
+    # before paying for base64/JSON parsing and the HMAC verify
+    if token.count(".") != 2:
+        raise JWTError("malformed token")
+
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        user_id, exp = cached
+        if exp is None or exp > time.time():
+            return user_id
+        # Expired entry: fall through so jwt.decode raises as usual
+
+    payload = jwt.decode(
+        token,
+        _JWT_KEY,
+        algorithms=_JWT_ALGORITHMS,
+        options={"require": ["sub", "exp"]},
+    )
+    user_id = payload["sub"]
+    if not isinstance(user_id, int):
+        # Tokens minted before sub became an int carry it as a string
+        user_id = int(user_id)
+    _token_cache[key] = (user_id, payload.get("exp"))
+    return user_id
+
+
+# Short-TTL cache of user column snapshots so hot users skip the
+# per-request SELECT. Snapshots are plain values, not Session-bound
+# instances; any future endpoint that mutates a user must call
+# _invalidate_user so changes are visible within the TTL.
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=60)
+
+
+def _invalidate_user(user_id: int) -> None:
+    """Drop a cached user snapshot, e.g. after a profile or password change."""
+    _user_cache.pop(user_id, None)
+
+
+async def _get_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """
+    Load a user by id, serving repeat lookups from the snapshot cache.
+
+    Returns a detached User rebuilt from cached column values on a hit,
+    which is all the read-only dependency consumers need.
+    """
+    snapshot = _user_cache.get(user_id)
+    if snapshot is not None:
+        return User(
+            id=snapshot[0],
+            username=snapshot[1],
+            password_hash=snapshot[2],
+            created_at=snapshot[3],
+            updated_at=snapshot[4],
+        )
+
+    # Session.get is the primary-key fast path: identity-map hit first,
+    # then a primed pk-lookup statement instead of a compiled SELECT
+    user = await db.get(User, user_id)
+    if user is not None:
+        _user_cache[user_id] = (
+            user.id,
+            user.username,
+            user.password_hash,
+            user.created_at,
+            user.updated_at,
+        )
+    return user
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """
     Validate JWT token and return authenticated user.
@@ -44,42 +144,24 @@ async def get_current_user(
     Raises:
         HTTPException 401: If token is missing, invalid, expired, or user doesn't exist
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
     token = credentials.credentials
-    
+
     try:
-        # Decode and validate token
-        payload = jwt.decode(
-            token, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
-        user_id_str: str = payload.get("sub")
-        
-        if user_id_str is None:
-            logger.warning("Token validation failed: missing 'sub' claim")
-            raise credentials_exception
-        
-        user_id = int(user_id_str)
-        
+        # Decode and validate token (cached after the first success)
+        user_id = _decode_token_user_id(token)
     except JWTError as e:
-        logger.warning(f"Token validation failed: {type(e).__name__}")
-        raise credentials_exception
+        logger.warning("Token validation failed: %s", type(e).__name__)
+        raise _CREDENTIALS_EXCEPTION
     except (ValueError, TypeError):
         logger.warning("Token validation failed: invalid 'sub' claim format")
-        raise credentials_exception
-    
-    # Load user from database
-    user = db.query(User).filter(User.id == user_id).first()
+        raise _CREDENTIALS_EXCEPTION
     
+    # Load user (snapshot cache first, database on miss)
+    user = await _get_user(db, user_id)
+
     if user is None:
         logger.warning(f"Token validation failed: user_id {user_id} not found")
-        raise credentials_exception
+        raise _CREDENTIALS_EXCEPTION
     
     logger.debug(f"User authenticated: {user.id}")
     return user
@@ -87,7 +169,7 @@ async def get_current_user(
 
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_optional),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Optional[User]:
     """
     Optionally validate JWT token and return authenticated user.
@@ -115,20 +197,8 @@ async def get_current_user_optional(
     token = credentials.credentials
     
     try:
-        payload = jwt.decode(
-            token, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
-        user_id_str: str = payload.get("sub")
-        
-        if user_id_str is None:
-            return None
-        
-        user_id = int(user_id_str)
-        
+        user_id = _decode_token_user_id(token)
     except (JWTError, ValueError, TypeError):
         return None
     
-    user = db.query(User).filter(User.id == user_id).first()
-    return user
+    return await _get_user(db, user_id)
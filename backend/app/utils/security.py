@@ -1,44 +1,100 @@
 """
 Security utilities for password hashing, verification, and JWT token management.
-Uses bcrypt for secure password storage and python-jose for JWT.
+Uses bcrypt for secure password storage and PyJWT for JWT.
 """
-from datetime import datetime, timedelta
-from typing import Optional
+import base64
+import hashlib
+import time
+from datetime import timedelta
+from typing import Optional, Tuple
 
-from jose import jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
 
 from app.config import settings
 
-# Password hashing context using bcrypt with automatic algorithm detection
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Signing key bytes prepared once; PyJWT otherwise re-encodes the secret
+# string on every jwt.encode call
+_SIGNING_KEY = settings.SECRET_KEY.encode("utf-8")
+
+
+def _prehash_password(password: str) -> bytes:
+    """
+    Reduce a password to base64(sha256(password)) before bcrypt.
+
+    Bcrypt silently truncates input at 72 bytes; pre-hashing makes the
+    input a fixed 44 bytes so arbitrarily long passwords keep their full
+    entropy. Base64 (not raw digest) avoids the null-byte truncation quirk
+    in bcrypt implementations.
+    """
+    return base64.b64encode(hashlib.sha256(password.encode("utf-8")).digest())
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
-    
+    Hash a password using bcrypt over a SHA-256 pre-hash.
+
+    Calls the bcrypt C module directly rather than going through passlib's
+    scheme-dispatch layer. The work factor comes from settings so non-prod
+    environments can run at a lower cost instead of burning ~100-300ms of
+    CPU per hash.
+
     Args:
         password: Plain text password
-        
+
     Returns:
-        Bcrypt hash of the password
+        Bcrypt hash of the pre-hashed password
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        _prehash_password(password),
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS),
+    ).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain text password against a hashed password.
-    
+
     Args:
         plain_password: Plain text password to verify
         hashed_password: Bcrypt hash to verify against
-        
+
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(
+        _prehash_password(plain_password),
+        hashed_password.encode("utf-8"),
+    )
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password against current and legacy hash schemes.
+
+    Hashes stored before the SHA-256 pre-hash landed were bcrypt over the
+    raw password bytes. When one of those still verifies, return a
+    replacement hash in the current scheme so the caller can store it
+    (opportunistic upgrade on login).
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Stored bcrypt hash, either scheme
+
+    Returns:
+        (valid, new_hash) where new_hash is a current-scheme hash to
+        persist, or None if the stored hash is already current (or the
+        password was wrong)
+    """
+    hashed = hashed_password.encode("utf-8")
+    if bcrypt.checkpw(_prehash_password(plain_password), hashed):
+        return True, None
+    # Legacy scheme: raw password bytes, truncated at 72 as bcrypt did
+    if bcrypt.checkpw(plain_password.encode("utf-8")[:72], hashed):
+        return True, hash_password(plain_password)
+    return False, None
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -55,13 +111,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         Encoded JWT token string
     """
     to_encode = data.copy()
-    
+
+    # exp is a NumericDate (seconds since epoch), so work in integers
+    # directly instead of allocating datetime/timedelta objects per token.
+    # Also sidesteps datetime.utcnow(), deprecated since Python 3.12.
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(hours=settings.ACCESS_TOKEN_EXPIRE_HOURS)
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        expire = int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_HOURS * 3600
+
+    to_encode["exp"] = expire
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
     
     return encoded_jwt
@@ -1,53 +1,305 @@
 """
 Pytest configuration and fixtures for testing.
 """
+import logging
+import os
+
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+
+from app.config import settings
+
+# Drop bcrypt to its minimum cost before the app (and anything that hashes
+# at import time) is loaded: cost is 2^rounds, so 12 -> 4 makes every
+# register/login in the suite ~256x cheaper without changing behavior.
+settings.BCRYPT_ROUNDS = 4
 
 from app.main import app
 from app.database import Base, get_db
+from app.utils.auth import _user_cache
+from app.utils.security import hash_password
 
 
-# Create an in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Use a shared-cache in-memory SQLite database for testing so the async
+# engine (used by the app) and the sync engine (used by test fixtures)
+# see the same data. The database name includes the pytest-xdist worker id
+# (gw0, gw1, ...) so parallel workers don't share state; single-process
+# runs fall back to one fixed name.
+# Keep per-query parameter formatting out of the hot path: statement echo
+# stays off and the engine logger won't format bound parameters at INFO
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
-engine = create_engine(
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+SQLALCHEMY_DATABASE_URL = (
+    f"sqlite+aiosqlite:///file:testdb_{_WORKER}?mode=memory&cache=shared&uri=true"
+)
+SYNC_SQLALCHEMY_DATABASE_URL = (
+    f"sqlite:///file:testdb_{_WORKER}?mode=memory&cache=shared&uri=true"
+)
+
+# NullPool so each checkout gets a fresh aiosqlite connection: pooled
+# connections are bound to the event loop (and worker thread) they were
+# created on, which hangs across tests and at interpreter shutdown. The
+# sync engine's StaticPool keeps the shared in-memory database alive.
+async_engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
+    echo=False,
+    poolclass=NullPool,
+)
+TestingSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# Sync engine for schema management and direct database access in tests
+engine = create_engine(
+    SYNC_SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
+    echo=False,
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SyncTestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """SQLite only enforces ON DELETE CASCADE with this pragma enabled."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
 
 
-def override_get_db():
+async def override_get_db():
     """Override database dependency with test database."""
-    db = TestingSessionLocal()
-    try:
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _memoize_hash_password():
+    """
+    Memoize hash_password for the duration of the session: nearly every
+    registration test uses the literal 'password123', so N registrations
+    cost one bcrypt key schedule instead of N. verify_password is left
+    untouched, and tests that imported hash_password directly (e.g. the
+    salting test) still get the unpatched function.
+    """
+    from app.routers import auth as auth_router
+    from app.utils import security
+
+    original = security.hash_password
+
+    def cached_hash_password(password):
+        cached = _password_hash_cache.get(password)
+        if cached is None:
+            cached = _password_hash_cache[password] = original(password)
+        return cached
+
+    security.hash_password = cached_hash_password
+    auth_router.hash_password = cached_hash_password
+    yield
+    security.hash_password = original
+    auth_router.hash_password = original
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_bcrypt():
+    """
+    Force the bcrypt C extension load and urandom initialization once per
+    session (and per xdist worker) so no test body pays the warm-up cost.
+    Runs at the BCRYPT_ROUNDS configured above, matching test-time cost.
+    """
+    hash_password("warmup")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_schema_validators():
+    """
+    Run each request schema through one validation per session (and per
+    xdist worker) so first-call validator setup isn't charged to whichever
+    test happens to touch the schema first.
+    """
+    from app.schemas.todo_item import TodoItemCreate, TodoItemUpdateCompletion
+    from app.schemas.auth import LoginRequest
+    from app.schemas.user import UserCreate
+
+    TodoItemCreate.model_validate({"text": "x"})
+    TodoItemUpdateCompletion.model_validate({"completed": True})
+    UserCreate.model_validate({"username": "warmup", "password": "password123"})
+    LoginRequest.model_validate({"username": "warmup", "password": "password123"})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _create_schema():
+    """
+    Create the schema once for the whole session instead of running every
+    CREATE TABLE / DROP TABLE in each fixture.
+    """
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def _clean_tables(_create_schema):
+    """
+    Wipe table contents after each test. DELETE per table is far cheaper
+    than the previous drop_all/create_all cycle and keeps tests isolated.
+    """
+    yield
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+@pytest.fixture(scope="session")
+def _session_client():
+    """
+    One TestClient for the whole session: the ASGI middleware stack, route
+    compilation and httpx transport are built once instead of per test.
+    """
+    app.dependency_overrides[get_db] = override_get_db
+    test_client = TestClient(app)
+    yield test_client
+    app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def client():
+def client(_session_client):
     """
     Test client fixture for making requests to the FastAPI app.
     Uses an in-memory SQLite database for isolation.
     """
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-    
-    # Override the database dependency
+    # User ids repeat across tests since each test starts from empty
+    # tables, so drop any snapshots cached during a previous test
+    _user_cache.clear()
+    return _session_client
+
+
+# Password hashes reused by fixtures; computed once per session so fixture
+# setup does not pay a bcrypt hash per test
+_password_hash_cache = {}
+
+
+def _cached_password_hash(password):
+    cached = _password_hash_cache.get(password)
+    if cached is None:
+        cached = _password_hash_cache[password] = hash_password(password)
+    return cached
+
+
+@pytest.fixture(scope="session")
+def sample_bcrypt():
+    """
+    One (password, hash) pair for the password-verification tests, hashed
+    once per session: those tests assert on verify_password, so they don't
+    each need to pay for their own key derivation.
+    """
+    password = "testpassword123"
+    return password, hash_password(password)
+
+
+@pytest.fixture
+def case_user(client, db_session):
+    """
+    Pre-registered 'caseuser' (password123) for duplicate-registration and
+    case-insensitivity tests. Inserted directly with a session-cached hash
+    so tests only pay for the operation under test.
+    """
+    from app.models.user import User
+    db_session.add(
+        User(username="caseuser", password_hash=_cached_password_hash("password123"))
+    )
+    db_session.commit()
+
+
+@pytest.fixture
+def auth_token_factory(client, db_session):
+    """
+    Factory that creates a user and mints their token without HTTP.
+
+    Setup-only replacement for register+login round-trips: inserts the
+    user directly with a session-cached hash and signs the token in
+    process, skipping two ASGI calls and the login-side bcrypt verify.
+    Tests exercising the HTTP register/login paths keep using the API.
+    """
+    from app.models.user import User
+    from app.utils.security import create_access_token
+
+    def _make(username="testuser", password="password123"):
+        user = User(username=username, password_hash=_cached_password_hash(password))
+        db_session.add(user)
+        db_session.commit()
+        token = create_access_token({"sub": user.id, "username": username})
+        return {
+            "access_token": token,
+            "token_type": "bearer",
+            "user": {"id": user.id, "username": username},
+        }
+
+    return _make
+
+
+@pytest.fixture
+def auth_headers(auth_token_factory):
+    """
+    Authorization headers for a default user, built once per test.
+
+    For tests that only need "an authenticated request" and never look at
+    the token or user id, this replaces the per-call header dict
+    construction with one dict shared across the test's requests.
+    """
+    login = auth_token_factory()
+    return {"Authorization": f"Bearer {login['access_token']}"}
+
+
+@pytest.fixture
+def authed_user(client):
+    """
+    Canonical registered + logged-in user for read-only tests.
+
+    Returns the login response JSON ({access_token, token_type, user}) so
+    tests that only need "some authenticated user" share one setup path
+    instead of each registering and logging in inline. Function-scoped
+    because the autouse cleanup wipes tables between tests.
+    """
+    client.post(
+        "/api/auth/register",
+        json={"username": "testuser", "password": "password123"}
+    )
+    return client.post(
+        "/api/auth/login",
+        json={"username": "testuser", "password": "password123"}
+    ).json()
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """
+    Async test client for tests that overlap independent requests with
+    asyncio.gather (e.g. concurrent register/login setup calls).
+    """
+    _user_cache.clear()
     app.dependency_overrides[get_db] = override_get_db
-    
-    yield TestClient(app)
-    
-    # Clean up
-    app.dependency_overrides.clear()
-    Base.metadata.drop_all(bind=engine)
+    # ASGITransport dispatches straight into the app coroutine: no HTTP
+    # framing and no anyio portal thread hop like the sync TestClient
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture
+async def async_db_session():
+    """
+    AsyncSession on the test database for calling route handlers directly,
+    bypassing the ASGI stack when only the handler logic is under test.
+    """
+    async with TestingSessionLocal() as db:
+        yield db
 
 
 @pytest.fixture
@@ -55,8 +307,6 @@ def db_session():
     """
     Database session fixture for direct database access in tests.
     """
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    db = SyncTestingSessionLocal()
     yield db
     db.close()
-    Base.metadata.drop_all(bind=engine)
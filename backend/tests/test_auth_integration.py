@@ -2,9 +2,11 @@
 Integration tests for the complete authentication flow.
 Tests the end-to-end authentication journey from registration to protected resource access.
 """
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
-from jose import jwt
+import jwt
 from app.config import get_settings
 
 settings = get_settings()
@@ -67,36 +69,40 @@ class TestAuthenticationFlow:
         assert response.status_code == 200
         assert "access_token" in response.json()
 
-    def test_multiple_users_isolation(self, client):
+    async def test_multiple_users_isolation(self, async_client):
         """Test that multiple users have properly isolated sessions."""
-        # Register two users
-        client.post(
+        # Register two users. These writes stay sequential: SQLite's
+        # shared-cache mode takes table locks, so concurrent INSERTs from
+        # separate connections fail with "database table is locked".
+        await async_client.post(
             "/api/auth/register",
             json={"username": "user_a", "password": "password123"}
         )
-        client.post(
+        await async_client.post(
             "/api/auth/register",
             json={"username": "user_b", "password": "password456"}
         )
-        
-        # Login as user_a
-        login_a = client.post(
-            "/api/auth/login",
-            json={"username": "user_a", "password": "password123"}
+
+        # Login as both users concurrently
+        login_a, login_b = await asyncio.gather(
+            async_client.post(
+                "/api/auth/login",
+                json={"username": "user_a", "password": "password123"}
+            ),
+            async_client.post(
+                "/api/auth/login",
+                json={"username": "user_b", "password": "password456"}
+            ),
         )
         token_a = login_a.json()["access_token"]
-        
-        # Login as user_b
-        login_b = client.post(
-            "/api/auth/login",
-            json={"username": "user_b", "password": "password456"}
-        )
         token_b = login_b.json()["access_token"]
-        
+
         # Each token should return the correct user
-        me_a = client.get("/api/auth/me", headers={"Authorization": f"Bearer {token_a}"})
-        me_b = client.get("/api/auth/me", headers={"Authorization": f"Bearer {token_b}"})
-        
+        me_a, me_b = await asyncio.gather(
+            async_client.get("/api/auth/me", headers={"Authorization": f"Bearer {token_a}"}),
+            async_client.get("/api/auth/me", headers={"Authorization": f"Bearer {token_b}"}),
+        )
+
         assert me_a.json()["username"] == "user_a"
         assert me_b.json()["username"] == "user_b"
 
@@ -342,35 +348,40 @@ class TestTokenValidation:
         
         assert response.status_code == 401
 
-    def test_multiple_logins_return_valid_tokens(self, client):
+    async def test_multiple_logins_return_valid_tokens(self, async_client):
         """Test that each login returns a valid, usable token."""
         # Register
-        client.post(
+        await async_client.post(
             "/api/auth/register",
             json={"username": "multilogin", "password": "password123"}
         )
-        
-        # Login multiple times
-        token1 = client.post(
-            "/api/auth/login",
-            json={"username": "multilogin", "password": "password123"}
-        ).json()["access_token"]
-        
-        token2 = client.post(
-            "/api/auth/login",
-            json={"username": "multilogin", "password": "password123"}
-        ).json()["access_token"]
-        
-        # Both tokens should be valid and usable
-        response1 = client.get(
-            "/api/auth/me",
-            headers={"Authorization": f"Bearer {token1}"}
+
+        # Login multiple times, concurrently — the calls are independent
+        login1, login2 = await asyncio.gather(
+            async_client.post(
+                "/api/auth/login",
+                json={"username": "multilogin", "password": "password123"}
+            ),
+            async_client.post(
+                "/api/auth/login",
+                json={"username": "multilogin", "password": "password123"}
+            ),
         )
-        response2 = client.get(
-            "/api/auth/me",
-            headers={"Authorization": f"Bearer {token2}"}
+        token1 = login1.json()["access_token"]
+        token2 = login2.json()["access_token"]
+
+        # Both tokens should be valid and usable
+        response1, response2 = await asyncio.gather(
+            async_client.get(
+                "/api/auth/me",
+                headers={"Authorization": f"Bearer {token1}"}
+            ),
+            async_client.get(
+                "/api/auth/me",
+                headers={"Authorization": f"Bearer {token2}"}
+            ),
         )
-        
+
         assert response1.status_code == 200
         assert response2.status_code == 200
         assert response1.json()["username"] == "multilogin"
@@ -3,10 +3,30 @@ Tests for JWT authentication middleware/dependency.
 """
 import pytest
 from datetime import timedelta
-from jose import jwt
+import jwt
 from app.config import settings
 from app.utils.security import create_access_token
 
+# Invalid tokens computed once at import; each is a fresh HMAC + JSON
+# serialization that no test needs to repeat per run
+EXPIRED_TOKEN = create_access_token(
+    data={"sub": 1, "username": "expireduser"},
+    expires_delta=timedelta(seconds=-1)
+)
+WRONG_SIG_TOKEN = jwt.encode(
+    {"sub": 1, "username": "testuser"},
+    "wrong-secret-key",
+    algorithm="HS256"
+)
+MISSING_SUB_TOKEN = jwt.encode(
+    {"username": "testuser"},
+    settings.SECRET_KEY,
+    algorithm=settings.ALGORITHM
+)
+NONEXISTENT_USER_TOKEN = create_access_token(
+    data={"sub": 99999, "username": "deleteduser"}
+)
+
 
 class TestAuthMiddleware:
     """Tests for authentication middleware and protected endpoints."""
@@ -15,25 +35,12 @@ class TestAuthMiddleware:
         """Helper to create Authorization header."""
         return {"Authorization": f"Bearer {token}"}
 
-    def _register_and_login(self, client, username="testuser", password="password123"):
-        """Helper to register a user and get their token."""
-        client.post(
-            "/api/auth/register",
-            json={"username": username, "password": password}
-        )
-        response = client.post(
-            "/api/auth/login",
-            json={"username": username, "password": password}
-        )
-        return response.json()
-
-    def test_valid_token_returns_user(self, client):
+    def test_valid_token_returns_user(self, client, authed_user):
         """Test that valid token returns user object in protected endpoint."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
+        token = authed_user["access_token"]
+
         response = client.get("/api/auth/me", headers=self._get_auth_header(token))
-        
+
         assert response.status_code == 200
         data = response.json()
         assert data["username"] == "testuser"
@@ -57,67 +64,38 @@ class TestAuthMiddleware:
 
     def test_expired_token_returns_401(self, client):
         """Test that expired token returns 401."""
-        # Register a user first
-        login_data = self._register_and_login(client, username="expireduser")
-        user_id = login_data["user"]["id"]
-        
-        # Create an expired token
-        expired_token = create_access_token(
-            data={"sub": str(user_id), "username": "expireduser"},
-            expires_delta=timedelta(seconds=-1)  # Already expired
-        )
-        
         response = client.get(
             "/api/auth/me",
-            headers=self._get_auth_header(expired_token)
+            headers=self._get_auth_header(EXPIRED_TOKEN)
         )
-        
+
         assert response.status_code == 401
 
     def test_token_with_invalid_signature_returns_401(self, client):
         """Test that token with invalid signature returns 401."""
-        # Create token with wrong secret key
-        token = jwt.encode(
-            {"sub": "1", "username": "testuser"},
-            "wrong-secret-key",
-            algorithm="HS256"
-        )
-        
         response = client.get(
             "/api/auth/me",
-            headers=self._get_auth_header(token)
+            headers=self._get_auth_header(WRONG_SIG_TOKEN)
         )
-        
+
         assert response.status_code == 401
 
     def test_token_with_missing_sub_claim_returns_401(self, client):
         """Test that token without 'sub' claim returns 401."""
-        # Create token without sub claim
-        token = jwt.encode(
-            {"username": "testuser"},  # Missing 'sub'
-            settings.SECRET_KEY,
-            algorithm=settings.ALGORITHM
-        )
-        
         response = client.get(
             "/api/auth/me",
-            headers=self._get_auth_header(token)
+            headers=self._get_auth_header(MISSING_SUB_TOKEN)
         )
-        
+
         assert response.status_code == 401
 
-    def test_token_for_nonexistent_user_returns_401(self, client, db_session):
+    def test_token_for_nonexistent_user_returns_401(self, client):
         """Test that token for deleted/non-existent user returns 401."""
-        # Create token for user_id that doesn't exist
-        token = create_access_token(
-            data={"sub": "99999", "username": "deleteduser"}
-        )
-        
         response = client.get(
             "/api/auth/me",
-            headers=self._get_auth_header(token)
+            headers=self._get_auth_header(NONEXISTENT_USER_TOKEN)
         )
-        
+
         assert response.status_code == 401
 
     def test_protected_endpoint_requires_authentication(self, client):
@@ -126,44 +104,42 @@ class TestAuthMiddleware:
         response = client.get("/api/auth/me")
         assert response.status_code == 403  # HTTPBearer returns 403 for missing
 
-    def test_protected_endpoint_works_with_valid_token(self, client):
+    def test_protected_endpoint_works_with_valid_token(self, client, authed_user):
         """Test that protected endpoint works with valid token."""
-        login_data = self._register_and_login(client, username="validuser")
-        token = login_data["access_token"]
-        
+        token = authed_user["access_token"]
+
         response = client.get(
             "/api/auth/me",
             headers=self._get_auth_header(token)
         )
-        
+
         assert response.status_code == 200
-        assert response.json()["username"] == "validuser"
+        assert response.json()["username"] == "testuser"
 
-    def test_me_endpoint_returns_correct_user_data(self, client):
+    def test_me_endpoint_returns_correct_user_data(self, client, authed_user):
         """Test that /me endpoint returns correct user data."""
-        login_data = self._register_and_login(client, username="meuser")
-        token = login_data["access_token"]
-        user_id = login_data["user"]["id"]
-        
+        token = authed_user["access_token"]
+        user_id = authed_user["user"]["id"]
+
         response = client.get(
             "/api/auth/me",
             headers=self._get_auth_header(token)
         )
-        
+
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == user_id
-        assert data["username"] == "meuser"
+        assert data["username"] == "testuser"
         assert "created_at" in data
         # Password should never be in response
         assert "password" not in data
         assert "password_hash" not in data
 
-    def test_different_users_get_their_own_data(self, client):
+    def test_different_users_get_their_own_data(self, client, auth_token_factory):
         """Test that different users get their own data from /me."""
         # Create two users
-        login1 = self._register_and_login(client, username="user1", password="password123")
-        login2 = self._register_and_login(client, username="user2", password="password123")
+        login1 = auth_token_factory(username="user1")
+        login2 = auth_token_factory(username="user2")
         
         # Each user should get their own data
         response1 = client.get(
@@ -179,24 +155,21 @@ class TestAuthMiddleware:
         assert response2.json()["username"] == "user2"
         assert response1.json()["id"] != response2.json()["id"]
 
-    def test_malformed_bearer_token_returns_401(self, client):
+    @pytest.mark.parametrize("token", [
+        "not-a-jwt",
+        "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9",  # Incomplete JWT
+    ])
+    def test_malformed_bearer_token_returns_401(self, client, token):
         """Test that malformed bearer token returns 401."""
-        # Test various malformed tokens
-        malformed_tokens = [
-            "not-a-jwt",
-            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9",  # Incomplete JWT
-        ]
-        
-        for token in malformed_tokens:
-            response = client.get(
-                "/api/auth/me",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            assert response.status_code == 401, f"Token '{token}' should return 401"
-
-    def test_wrong_auth_scheme_returns_error(self, client):
+        response = client.get(
+            "/api/auth/me",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 401, f"Token '{token}' should return 401"
+
+    def test_wrong_auth_scheme_returns_error(self, client, auth_token_factory):
         """Test that wrong authentication scheme returns error."""
-        login_data = self._register_and_login(client, username="schemeuser")
+        login_data = auth_token_factory(username="schemeuser")
         token = login_data["access_token"]
         
         # Use Basic instead of Bearer
@@ -207,3 +180,82 @@ class TestAuthMiddleware:
         
         # HTTPBearer rejects non-Bearer schemes
         assert response.status_code in [401, 403]
+
+
+class TestTokenValidationCache:
+    """Tests for the memoized JWT validation in utils/auth."""
+
+    def test_cached_decode_returns_same_user_id(self):
+        """Test that a repeated decode of the same token is served from cache."""
+        from app.utils import auth as auth_utils
+
+        token = create_access_token(data={"sub": "42", "username": "cacheduser"})
+        first = auth_utils._decode_token_user_id(token)
+        second = auth_utils._decode_token_user_id(token)
+
+        assert first == 42
+        assert second == 42
+
+    def test_invalid_token_is_not_cached(self):
+        """Test that failed validations raise every time and are never cached."""
+        from jwt import InvalidTokenError as JWTError
+        from app.utils import auth as auth_utils
+
+        auth_utils._token_cache.clear()
+        with pytest.raises(JWTError):
+            auth_utils._decode_token_user_id("not-a-jwt")
+        assert len(auth_utils._token_cache) == 0
+
+    def test_expired_cache_entry_raises(self):
+        """Test that an expired token raises even if it was cached while valid."""
+        import hashlib
+        import time as time_module
+        from jwt import ExpiredSignatureError
+        from app.utils import auth as auth_utils
+
+        token = create_access_token(
+            data={"sub": "7", "username": "expireduser"},
+            expires_delta=timedelta(seconds=-1)
+        )
+        # Simulate a validation cached before the token expired
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        auth_utils._token_cache[key] = (7, time_module.time() - 1)
+
+        with pytest.raises(ExpiredSignatureError):
+            auth_utils._decode_token_user_id(token)
+
+
+class TestUserLookupCache:
+    """Tests for the user snapshot cache in utils/auth."""
+
+    def test_user_cached_after_authenticated_request(self, client):
+        """Test that an authenticated request populates the user cache."""
+        from app.utils import auth as auth_utils
+
+        client.post(
+            "/api/auth/register",
+            json={"username": "cacheduser", "password": "password123"}
+        )
+        login = client.post(
+            "/api/auth/login",
+            json={"username": "cacheduser", "password": "password123"}
+        ).json()
+
+        response = client.get(
+            "/api/auth/me",
+            headers={"Authorization": f"Bearer {login['access_token']}"}
+        )
+
+        assert response.status_code == 200
+        assert login["user"]["id"] in auth_utils._user_cache
+
+    def test_invalidate_user_drops_snapshot(self):
+        """Test that _invalidate_user removes the cached snapshot."""
+        from app.utils import auth as auth_utils
+
+        auth_utils._user_cache[99] = (99, "stale", "hash", None, None)
+        auth_utils._invalidate_user(99)
+
+        assert 99 not in auth_utils._user_cache
+        # Invalidating an uncached id is a no-op
+        auth_utils._invalidate_user(99)
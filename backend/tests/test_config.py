@@ -8,6 +8,10 @@ from app.config import Settings, get_settings, settings
 def test_settings_has_required_fields():
     """Test that settings has all required configuration fields."""
     assert hasattr(settings, 'DATABASE_URL')
+    assert hasattr(settings, 'DB_POOL_SIZE')
+    assert hasattr(settings, 'DB_MAX_OVERFLOW')
+    assert hasattr(settings, 'DB_POOL_TIMEOUT')
+    assert hasattr(settings, 'DB_POOL_RECYCLE')
     assert hasattr(settings, 'SECRET_KEY')
     assert hasattr(settings, 'ALGORITHM')
     assert hasattr(settings, 'ACCESS_TOKEN_EXPIRE_HOURS')
@@ -16,12 +20,18 @@ def test_settings_has_required_fields():
 
 def test_settings_default_values():
     """Test that settings has sensible default values."""
-    # Create a new settings instance with defaults
-    test_settings = Settings()
-    
+    # model_construct skips env lookup, .env parsing and validation — we
+    # only want the declared field defaults, and this also keeps values
+    # leaked into the process env from affecting the assertions
+    test_settings = Settings.model_construct()
+
     assert test_settings.ALGORITHM == "HS256"
     assert test_settings.ACCESS_TOKEN_EXPIRE_HOURS == 24
     assert isinstance(test_settings.CORS_ORIGINS, list)
+    assert test_settings.DB_POOL_SIZE == 20
+    assert test_settings.DB_MAX_OVERFLOW == 40
+    assert test_settings.DB_POOL_TIMEOUT == 30
+    assert test_settings.DB_POOL_RECYCLE == 3600
 
 
 def test_get_settings_returns_settings_instance():
@@ -0,0 +1,34 @@
+"""
+Tests for database session management.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app import database
+from tests.conftest import TestingSessionLocal, async_engine
+
+
+def test_get_db_yields_async_session(monkeypatch):
+    """Test that the get_db dependency yields a usable AsyncSession."""
+    monkeypatch.setattr(database, "SessionLocal", TestingSessionLocal)
+
+    async def run():
+        async for db in database.get_db():
+            assert isinstance(db, AsyncSession)
+
+    asyncio.run(run())
+
+
+def test_check_database_connection_success(monkeypatch):
+    """Test that check_database_connection returns True when the DB responds."""
+    monkeypatch.setattr(database, "engine", async_engine)
+    assert asyncio.run(database.check_database_connection()) is True
+
+
+def test_check_database_connection_failure(monkeypatch):
+    """Test that check_database_connection returns False when the DB is unreachable."""
+    bad_engine = create_async_engine("sqlite+aiosqlite:////nonexistent/path/test.db")
+    monkeypatch.setattr(database, "engine", bad_engine)
+    assert asyncio.run(database.check_database_connection()) is False
@@ -2,7 +2,7 @@
 Tests for user login endpoint.
 """
 import pytest
-from jose import jwt
+import jwt
 from app.config import settings
 
 
@@ -30,65 +30,32 @@ class TestLoginEndpoint:
         assert "user" in data
         assert data["user"]["username"] == "loginuser"
 
-    def test_token_payload_contains_user_info(self, client):
+    def test_token_payload_contains_user_info(self, authed_user):
         """Test that JWT token payload contains correct user_id and username."""
-        # Register user
-        reg_response = client.post(
-            "/api/auth/register",
-            json={"username": "payloaduser", "password": "password123"}
-        )
-        user_id = reg_response.json()["id"]
-        
-        # Login
-        response = client.post(
-            "/api/auth/login",
-            json={"username": "payloaduser", "password": "password123"}
-        )
-        
-        token = response.json()["access_token"]
-        
-        # Decode token without verification to check payload
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        
-        assert payload["sub"] == str(user_id)
-        assert payload["username"] == "payloaduser"
+        token = authed_user["access_token"]
 
-    def test_token_can_be_decoded_with_secret_key(self, client):
+        # Only claim values are under test here; signature verification has
+        # its own dedicated test, so skip the HMAC
+        payload = jwt.decode(token, options={"verify_signature": False})
+
+        assert payload["sub"] == authed_user["user"]["id"]
+        assert payload["username"] == "testuser"
+
+    def test_token_can_be_decoded_with_secret_key(self, authed_user):
         """Test that token can be decoded with SECRET_KEY."""
-        # Register and login
-        client.post(
-            "/api/auth/register",
-            json={"username": "decodeuser", "password": "password123"}
-        )
-        
-        response = client.post(
-            "/api/auth/login",
-            json={"username": "decodeuser", "password": "password123"}
-        )
-        
-        token = response.json()["access_token"]
-        
+        token = authed_user["access_token"]
+
         # This should not raise an exception
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         assert "sub" in payload
         assert "username" in payload
 
-    def test_token_has_expiration_time(self, client):
+    def test_token_has_expiration_time(self, authed_user):
         """Test that JWT token has expiration time set."""
-        # Register and login
-        client.post(
-            "/api/auth/register",
-            json={"username": "expireuser", "password": "password123"}
-        )
-        
-        response = client.post(
-            "/api/auth/login",
-            json={"username": "expireuser", "password": "password123"}
-        )
-        
-        token = response.json()["access_token"]
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        
+        token = authed_user["access_token"]
+        # Claim presence only — no need to verify the signature here
+        payload = jwt.decode(token, options={"verify_signature": False})
+
         assert "exp" in payload
         assert payload["exp"] is not None
 
@@ -143,15 +110,9 @@ class TestLoginEndpoint:
         assert response1.json()["detail"] == response2.json()["detail"]
         assert response1.json()["detail"] == "Invalid credentials"
 
-    def test_login_is_case_insensitive(self, client):
+    def test_login_is_case_insensitive(self, client, case_user):
         """Test that login works regardless of username case."""
-        # Register with lowercase
-        client.post(
-            "/api/auth/register",
-            json={"username": "caseuser", "password": "password123"}
-        )
-        
-        # Login with different cases
+        # Login with different cases of the pre-registered lowercase user
         response1 = client.post(
             "/api/auth/login",
             json={"username": "CASEUSER", "password": "password123"}
@@ -195,24 +156,10 @@ class TestLoginEndpoint:
         assert token1.count(".") == 2  # JWT has 3 parts
         assert token2.count(".") == 2
 
-    def test_login_response_contains_user_info(self, client):
+    def test_login_response_contains_user_info(self, authed_user):
         """Test that login response contains user id and username."""
-        # Register
-        reg_response = client.post(
-            "/api/auth/register",
-            json={"username": "infouser", "password": "password123"}
-        )
-        user_id = reg_response.json()["id"]
-        
-        # Login
-        response = client.post(
-            "/api/auth/login",
-            json={"username": "infouser", "password": "password123"}
-        )
-        
-        data = response.json()
-        assert data["user"]["id"] == user_id
-        assert data["user"]["username"] == "infouser"
+        assert authed_user["user"]["id"] is not None
+        assert authed_user["user"]["username"] == "testuser"
 
     def test_missing_username_returns_422(self, client):
         """Test that missing username returns validation error."""
@@ -238,20 +185,32 @@ class TestLoginEndpoint:
         
         assert response.status_code == 422
 
-    def test_response_does_not_include_password(self, client):
+    def test_response_does_not_include_password(self, authed_user):
         """Test that login response never includes password."""
-        # Register and login
-        client.post(
-            "/api/auth/register",
-            json={"username": "nopassresp", "password": "password123"}
-        )
-        
+        assert "password" not in authed_user
+        assert "password_hash" not in authed_user
+        assert "password" not in authed_user.get("user", {})
+
+    def test_legacy_hash_upgraded_on_login(self, client, db_session):
+        """Test that a pre-prehash bcrypt hash is upgraded after a successful login."""
+        import bcrypt
+        from app.models.user import User
+        from app.utils.security import verify_password
+
+        # Store a hash in the legacy scheme (bcrypt over the raw password)
+        legacy_hash = bcrypt.hashpw(
+            b"password123", bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+        ).decode()
+        db_session.add(User(username="legacyuser", password_hash=legacy_hash))
+        db_session.commit()
+
         response = client.post(
             "/api/auth/login",
-            json={"username": "nopassresp", "password": "password123"}
+            json={"username": "legacyuser", "password": "password123"}
         )
-        
-        data = response.json()
-        assert "password" not in data
-        assert "password_hash" not in data
-        assert "password" not in data.get("user", {})
+
+        assert response.status_code == 200
+        db_session.expire_all()
+        stored = db_session.query(User).filter(User.username == "legacyuser").first()
+        assert stored.password_hash != legacy_hash
+        assert verify_password("password123", stored.password_hash)
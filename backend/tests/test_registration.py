@@ -75,37 +75,25 @@ class TestRegistrationEndpoint:
         user = db_session.query(User).filter(User.username == "testuser").first()
         assert user is not None
 
-    def test_duplicate_username_returns_409(self, client):
+    def test_duplicate_username_returns_409(self, client, case_user):
         """Test that registering with existing username returns 409."""
-        # First registration
-        client.post(
-            "/api/auth/register",
-            json={"username": "duplicate", "password": "password123"}
-        )
-        
-        # Second registration with same username
+        # Registration with the pre-registered username
         response = client.post(
             "/api/auth/register",
-            json={"username": "duplicate", "password": "differentpassword"}
+            json={"username": "caseuser", "password": "differentpassword"}
         )
-        
+
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"].lower()
 
-    def test_username_case_insensitive_duplicate(self, client):
+    def test_username_case_insensitive_duplicate(self, client, case_user):
         """Test that username check is case-insensitive (John vs john)."""
-        # First registration
-        client.post(
-            "/api/auth/register",
-            json={"username": "john", "password": "password123"}
-        )
-        
-        # Second registration with different case
+        # Registration with a different case of the pre-registered username
         response = client.post(
             "/api/auth/register",
-            json={"username": "JOHN", "password": "password123"}
+            json={"username": "CASEUSER", "password": "password123"}
         )
-        
+
         assert response.status_code == 409
 
     def test_username_too_short_returns_422(self, client):
@@ -193,23 +181,20 @@ class TestRegistrationEndpoint:
         assert "password_hash" not in data
         assert "hashed_password" not in data
 
-    def test_sql_injection_handled_safely(self, client):
+    @pytest.mark.parametrize("injection", [
+        "'; DROP TABLE users; --",
+        "1; DELETE FROM users",
+        "admin'--",
+        "1 OR 1=1",
+    ])
+    def test_sql_injection_handled_safely(self, client, injection):
         """Test that SQL injection attempts are handled safely."""
-        # Try various SQL injection patterns
-        injection_attempts = [
-            "'; DROP TABLE users; --",
-            "1; DELETE FROM users",
-            "admin'--",
-            "1 OR 1=1",
-        ]
-        
-        for injection in injection_attempts:
-            response = client.post(
-                "/api/auth/register",
-                json={"username": injection, "password": "password123"}
-            )
-            # Should either reject with 422 (invalid chars) or succeed without harm
-            assert response.status_code in [201, 422]
+        response = client.post(
+            "/api/auth/register",
+            json={"username": injection, "password": "password123"}
+        )
+        # Should either reject with 422 (invalid chars) or succeed without harm
+        assert response.status_code in [201, 422]
 
     def test_multiple_users_can_register(self, client):
         """Test that multiple different users can register."""
@@ -2,24 +2,27 @@
 Tests for TodoItem model and schemas.
 """
 import pytest
+from sqlalchemy.orm import joinedload, selectinload
 from pydantic import ValidationError
 
 from app.models.todo_item import TodoItem
 from app.models.user import User
 from app.schemas.todo_item import TodoItemCreate, TodoItemUpdateCompletion, TodoItemResponse
 
+# Length-boundary payloads built once at import instead of per test run
+TEXT_AT_MAX = "x" * 500
+TEXT_OVER_MAX = "x" * 501
+
 
 class TestTodoItemModel:
     """Tests for TodoItem SQLAlchemy model."""
 
     def test_todo_item_model_has_required_fields(self):
         """Test that TodoItem model has all required fields."""
-        assert hasattr(TodoItem, 'id')
-        assert hasattr(TodoItem, 'user_id')
-        assert hasattr(TodoItem, 'text')
-        assert hasattr(TodoItem, 'completed')
-        assert hasattr(TodoItem, 'created_at')
-        assert hasattr(TodoItem, 'updated_at')
+        # One set comparison against the mapper's keys instead of six
+        # InstrumentedAttribute descriptor lookups
+        expected = {'id', 'user_id', 'text', 'completed', 'created_at', 'updated_at'}
+        assert expected <= set(TodoItem.__mapper__.attrs.keys())
 
     def test_todo_item_model_tablename(self):
         """Test that TodoItem model has correct table name."""
@@ -30,7 +33,7 @@ class TestTodoItemModel:
         # Create a user first
         user = User(username="testuser", password_hash="hashedpassword")
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # assigns user.id without ending the transaction
         
         todo = TodoItem(user_id=user.id, text="Test todo", completed=False)
         db_session.add(todo)
@@ -45,7 +48,7 @@ class TestTodoItemModel:
         """Test that TodoItem can be created and saved."""
         user = User(username="todouser", password_hash="hashedpassword")
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # assigns user.id without ending the transaction
         
         todo = TodoItem(user_id=user.id, text="Buy groceries", completed=False)
         db_session.add(todo)
@@ -61,7 +64,7 @@ class TestTodoItemModel:
         """Test that completed defaults to False."""
         user = User(username="defaultuser", password_hash="hashedpassword")
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # assigns user.id without ending the transaction
         
         todo = TodoItem(user_id=user.id, text="Test default")
         db_session.add(todo)
@@ -73,17 +76,26 @@ class TestTodoItemModel:
         """Test foreign key relationship to User works."""
         user = User(username="reluser", password_hash="hashedpassword")
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # assigns user.id without ending the transaction
         
         todo = TodoItem(user_id=user.id, text="Related todo")
         db_session.add(todo)
         db_session.commit()
         
-        # Test relationship from todo to user
+        # Test relationship from todo to user (lazy="raise" requires an
+        # explicit eager load)
+        todo = db_session.query(TodoItem)\
+                         .options(joinedload(TodoItem.owner))\
+                         .filter(TodoItem.id == todo.id)\
+                         .one()
         assert todo.owner.id == user.id
         assert todo.owner.username == "reluser"
         
         # Test relationship from user to todos
+        user = db_session.query(User)\
+                         .options(selectinload(User.todo_items))\
+                         .filter(User.id == user.id)\
+                         .one()
         assert len(user.todo_items) == 1
         assert user.todo_items[0].text == "Related todo"
 
@@ -91,39 +103,50 @@ class TestTodoItemModel:
         """Test that deleting user deletes their todos."""
         user = User(username="cascadeuser", password_hash="hashedpassword")
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # assigns user.id without ending the transaction
         
-        todo1 = TodoItem(user_id=user.id, text="Todo 1")
-        todo2 = TodoItem(user_id=user.id, text="Todo 2")
-        db_session.add_all([todo1, todo2])
+        # Bulk path: plain rows, no unit-of-work bookkeeping per object
+        db_session.bulk_insert_mappings(
+            TodoItem,
+            [{"user_id": user.id, "text": f"Todo {i}"} for i in (1, 2)],
+        )
         db_session.commit()
-        
+
         # Get todo ids before deletion
-        todo_ids = [todo1.id, todo2.id]
+        todo_ids = [
+            tid for (tid,) in
+            db_session.query(TodoItem.id).filter(TodoItem.user_id == user.id)
+        ]
+        assert len(todo_ids) == 2
         
         # Delete the user
         db_session.delete(user)
         db_session.commit()
         
-        # Verify todos are deleted
-        remaining_todos = db_session.query(TodoItem).filter(
+        # Verify todos are deleted: existence check stops at the first row
+        # and skips ORM hydration entirely
+        remaining = db_session.query(TodoItem.id).filter(
             TodoItem.id.in_(todo_ids)
-        ).all()
-        assert len(remaining_todos) == 0
+        ).first()
+        assert remaining is None
 
     def test_user_can_have_multiple_todos(self, db_session):
         """Test that a user can have multiple to-do items."""
         user = User(username="multiuser", password_hash="hashedpassword")
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # assigns user.id without ending the transaction
         
-        todos = [
-            TodoItem(user_id=user.id, text=f"Todo {i}")
-            for i in range(5)
-        ]
-        db_session.add_all(todos)
+        # Bulk path: skips per-object history tracking and cascade checks
+        db_session.bulk_insert_mappings(
+            TodoItem,
+            [{"user_id": user.id, "text": f"Todo {i}"} for i in range(5)],
+        )
         db_session.commit()
         
+        user = db_session.query(User)\
+                         .options(selectinload(User.todo_items))\
+                         .filter(User.id == user.id)\
+                         .one()
         assert len(user.todo_items) == 5
 
 
@@ -148,11 +171,11 @@ class TestTodoItemSchemas:
     def test_todo_item_create_text_max_length(self):
         """Test maximum text length (500 characters)."""
         with pytest.raises(ValidationError):
-            TodoItemCreate(text="x" * 501)
+            TodoItemCreate(text=TEXT_OVER_MAX)
 
     def test_todo_item_create_text_at_max_length(self):
         """Test text at exactly max length is valid."""
-        data = TodoItemCreate(text="x" * 500)
+        data = TodoItemCreate(text=TEXT_AT_MAX)
         assert len(data.text) == 500
 
     def test_todo_item_update_completion_valid(self):
@@ -172,7 +195,7 @@ class TestTodoItemSchemas:
         """Test TodoItemResponse can be created from model."""
         user = User(username="respuser", password_hash="hashedpassword")
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # assigns user.id without ending the transaction
         
         todo = TodoItem(user_id=user.id, text="Response test", completed=True)
         db_session.add(todo)
@@ -4,40 +4,61 @@ Tests for to-do item CRUD endpoints.
 import pytest
 from app.models.todo_item import TodoItem
 from app.models.user import User
+from app.routers.todos import create_todo_item
+from app.schemas.todo_item import TodoItemCreate
+
+# Built once at import; shared by the length-validation tests
+TEXT_OVER_MAX = "x" * 501
 
 
 class TestTodosEndpoints:
     """Tests for /api/todos endpoints."""
 
+    @pytest.fixture(autouse=True)
+    def _bind_auth_token_factory(self, auth_token_factory):
+        self._auth_token_factory = auth_token_factory
+
     def _register_and_login(self, client, username="testuser", password="password123"):
-        """Helper to register a user and get their token."""
-        client.post(
-            "/api/auth/register",
-            json={"username": username, "password": password}
-        )
-        response = client.post(
-            "/api/auth/login",
-            json={"username": username, "password": password}
-        )
-        return response.json()
+        """Create a user and mint their token via the shared factory (no HTTP)."""
+        return self._auth_token_factory(username=username, password=password)
 
     def _get_auth_header(self, token: str) -> dict:
         """Helper to create Authorization header."""
         return {"Authorization": f"Bearer {token}"}
 
+    @pytest.fixture
+    def created_todo(self, client):
+        """Token and freshly created todo id shared by the update/delete tests."""
+        login_data = self._register_and_login(client)
+        token = login_data["access_token"]
+        create_response = client.post(
+            "/api/todos/",
+            json={"text": "Test todo"},
+            headers=self._get_auth_header(token)
+        )
+        return token, create_response.json()["id"]
+
+    def _handler_user(self, login_data) -> User:
+        """
+        Detached User for calling route handlers directly: the handlers
+        only read current_user.id, so no database load is needed.
+        """
+        return User(
+            id=login_data["user"]["id"],
+            username=login_data["user"]["username"],
+            password_hash="",
+        )
+
 
 class TestCreateTodo(TestTodosEndpoints):
     """Tests for POST /api/todos endpoint (Issue #18)."""
 
-    def test_authenticated_user_can_create_todo(self, client):
+    def test_authenticated_user_can_create_todo(self, client, auth_headers):
         """Test that authenticated user can create a todo item."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
         response = client.post(
             "/api/todos/",
             json={"text": "Buy groceries"},
-            headers=self._get_auth_header(token)
+            headers=auth_headers
         )
         
         assert response.status_code == 201
@@ -62,46 +83,68 @@ class TestCreateTodo(TestTodosEndpoints):
         data = response.json()
         assert data["user_id"] == user_id
 
-    def test_text_is_trimmed(self, client):
+    async def test_text_is_trimmed(self, client, async_db_session):
         """Test that text is trimmed (leading/trailing whitespace removed)."""
+        # Trimming is handler logic, so call the handler directly and skip
+        # the ASGI/httpx round-trip; HTTP semantics have their own tests
         login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
-        response = client.post(
-            "/api/todos/",
-            json={"text": "  Trimmed text  "},
-            headers=self._get_auth_header(token)
+
+        todo = await create_todo_item(
+            TodoItemCreate(text="  Trimmed text  "),
+            current_user=self._handler_user(login_data),
+            db=async_db_session,
         )
-        
-        data = response.json()
-        assert data["text"] == "Trimmed text"
 
-    def test_empty_text_returns_422(self, client):
+        assert todo.text == "Trimmed text"
+
+    def test_empty_text_returns_422(self, client, auth_headers):
         """Test that empty text returns validation error."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
         response = client.post(
             "/api/todos/",
             json={"text": ""},
-            headers=self._get_auth_header(token)
+            headers=auth_headers
         )
-        
+
         assert response.status_code == 422
 
-    def test_text_over_500_chars_returns_422(self, client):
+    def test_text_over_500_chars_returns_422(self, client, auth_headers):
         """Test that text over 500 chars returns validation error."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
         response = client.post(
             "/api/todos/",
-            json={"text": "x" * 501},
-            headers=self._get_auth_header(token)
+            json={"text": TEXT_OVER_MAX},
+            headers=auth_headers
         )
-        
+
         assert response.status_code == 422
 
+    def test_pagination_with_limit_and_cursor(self, client, auth_headers):
+        """Test that limit and cursor page through todos newest-first."""
+        for i in range(3):
+            client.post(
+                "/api/todos/",
+                json={"text": f"Todo {i}"},
+                headers=auth_headers
+            )
+
+        # First page: 2 items and a cursor pointing at the last one
+        response = client.get(
+            "/api/todos/?limit=2",
+            headers=auth_headers
+        )
+        page = response.json()
+        assert len(page["items"]) == 2
+        assert page["next_cursor"] == page["items"][-1]["id"]
+
+        # Second page: the remaining item, no further cursor
+        response = client.get(
+            f"/api/todos/?limit=2&cursor={page['next_cursor']}",
+            headers=auth_headers
+        )
+        page = response.json()
+        assert len(page["items"]) == 1
+        assert page["items"][0]["text"] == "Todo 0"
+        assert page["next_cursor"] is None
+
     def test_unauthenticated_request_returns_403(self, client):
         """Test that unauthenticated request returns 403."""
         response = client.post(
@@ -111,32 +154,72 @@ class TestCreateTodo(TestTodosEndpoints):
         
         assert response.status_code == 403
 
-    def test_created_todo_defaults_to_not_completed(self, client):
+    async def test_created_todo_defaults_to_not_completed(self, client, async_db_session):
         """Test that created todo defaults to completed=false."""
         login_data = self._register_and_login(client)
+
+        todo = await create_todo_item(
+            TodoItemCreate(text="New todo"),
+            current_user=self._handler_user(login_data),
+            db=async_db_session,
+        )
+
+        assert todo.completed is False
+
+    async def test_multiple_todos_can_be_created(self, client, async_db_session):
+        """Test that multiple todos can be created by same user."""
+        login_data = self._register_and_login(client)
+        user = self._handler_user(login_data)
+
+        for i in range(3):
+            todo = await create_todo_item(
+                TodoItemCreate(text=f"Todo {i}"),
+                current_user=user,
+                db=async_db_session,
+            )
+            assert todo.id is not None
+
+
+class TestBulkCreateTodos(TestTodosEndpoints):
+    """Tests for POST /api/todos/bulk endpoint."""
+
+    def test_bulk_create_returns_all_items(self, client):
+        """Test that bulk create writes and returns every item."""
+        login_data = self._register_and_login(client)
         token = login_data["access_token"]
-        
+
         response = client.post(
-            "/api/todos/",
-            json={"text": "New todo"},
+            "/api/todos/bulk",
+            json={"items": [{"text": f"Todo {i}"} for i in range(3)]},
             headers=self._get_auth_header(token)
         )
-        
+
+        assert response.status_code == 201
         data = response.json()
-        assert data["completed"] is False
+        assert len(data) == 3
+        assert {t["text"] for t in data} == {"Todo 0", "Todo 1", "Todo 2"}
+        assert all(t["completed"] is False for t in data)
 
-    def test_multiple_todos_can_be_created(self, client):
-        """Test that multiple todos can be created by same user."""
+    def test_bulk_create_empty_list_returns_422(self, client):
+        """Test that an empty items list is rejected."""
         login_data = self._register_and_login(client)
         token = login_data["access_token"]
-        
-        for i in range(3):
-            response = client.post(
-                "/api/todos/",
-                json={"text": f"Todo {i}"},
-                headers=self._get_auth_header(token)
-            )
-            assert response.status_code == 201
+
+        response = client.post(
+            "/api/todos/bulk",
+            json={"items": []},
+            headers=self._get_auth_header(token)
+        )
+
+        assert response.status_code == 422
+
+    def test_bulk_create_unauthenticated_returns_403(self, client):
+        """Test that bulk create requires authentication."""
+        response = client.post(
+            "/api/todos/bulk",
+            json={"items": [{"text": "Todo"}]}
+        )
+        assert response.status_code == 403
 
 
 class TestGetAllTodos(TestTodosEndpoints):
@@ -162,7 +245,7 @@ class TestGetAllTodos(TestTodosEndpoints):
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = response.json()["items"]
         assert len(data) == 3
 
     def test_todos_sorted_newest_first(self, client):
@@ -185,7 +268,7 @@ class TestGetAllTodos(TestTodosEndpoints):
             headers=self._get_auth_header(token)
         )
         
-        data = response.json()
+        data = response.json()["items"]
         # Newest should be first
         assert data[0]["text"] == "Third"
         assert data[2]["text"] == "First"
@@ -215,7 +298,7 @@ class TestGetAllTodos(TestTodosEndpoints):
             "/api/todos/",
             headers=self._get_auth_header(token1)
         )
-        data = response.json()
+        data = response.json()["items"]
         assert len(data) == 1
         assert data[0]["text"] == "User 1 todo"
 
@@ -230,7 +313,9 @@ class TestGetAllTodos(TestTodosEndpoints):
         )
         
         assert response.status_code == 200
-        assert response.json() == []
+        data = response.json()
+        assert data["items"] == []
+        assert data["next_cursor"] is None
 
     def test_unauthenticated_request_returns_403(self, client):
         """Test that unauthenticated request returns 403."""
@@ -241,77 +326,41 @@ class TestGetAllTodos(TestTodosEndpoints):
 class TestUpdateTodoCompletion(TestTodosEndpoints):
     """Tests for PATCH /api/todos/{id} endpoint (Issue #20)."""
 
-    def test_user_can_update_own_todo_completion(self, client):
+    def test_user_can_update_own_todo_completion(self, client, created_todo):
         """Test that user can update their own todo completion status."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
-        # Create a todo
-        create_response = client.post(
-            "/api/todos/",
-            json={"text": "Test todo"},
-            headers=self._get_auth_header(token)
-        )
-        todo_id = create_response.json()["id"]
-        
+        token, todo_id = created_todo
+
         # Update completion status
         response = client.patch(
             f"/api/todos/{todo_id}",
             json={"completed": True},
             headers=self._get_auth_header(token)
         )
-        
+
         assert response.status_code == 200
         data = response.json()
         assert data["completed"] is True
 
-    def test_toggle_from_false_to_true(self, client):
-        """Test toggle from false to true."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
-        create_response = client.post(
-            "/api/todos/",
-            json={"text": "Test todo"},
-            headers=self._get_auth_header(token)
-        )
-        todo_id = create_response.json()["id"]
-        
-        response = client.patch(
-            f"/api/todos/{todo_id}",
-            json={"completed": True},
-            headers=self._get_auth_header(token)
-        )
-        
-        assert response.json()["completed"] is True
+    @pytest.mark.parametrize("initial,target", [(False, True), (True, False)])
+    def test_toggle_completion(self, client, created_todo, initial, target):
+        """Test toggling completion in both directions."""
+        token, todo_id = created_todo
+
+        # New todos start at completed=False; set up the initial state
+        if initial:
+            client.patch(
+                f"/api/todos/{todo_id}",
+                json={"completed": initial},
+                headers=self._get_auth_header(token)
+            )
 
-    def test_toggle_from_true_to_false(self, client):
-        """Test toggle from true to false."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
-        # Create and mark complete
-        create_response = client.post(
-            "/api/todos/",
-            json={"text": "Test todo"},
-            headers=self._get_auth_header(token)
-        )
-        todo_id = create_response.json()["id"]
-        
-        client.patch(
-            f"/api/todos/{todo_id}",
-            json={"completed": True},
-            headers=self._get_auth_header(token)
-        )
-        
-        # Now toggle back to false
         response = client.patch(
             f"/api/todos/{todo_id}",
-            json={"completed": False},
+            json={"completed": target},
             headers=self._get_auth_header(token)
         )
-        
-        assert response.json()["completed"] is False
+
+        assert response.json()["completed"] is target
 
     def test_404_for_nonexistent_todo(self, client):
         """Test 404 for non-existent todo ID."""
@@ -361,104 +410,65 @@ class TestUpdateTodoCompletion(TestTodosEndpoints):
         
         assert response.status_code == 403
 
-    def test_text_and_other_fields_remain_unchanged(self, client):
+    def test_text_and_other_fields_remain_unchanged(self, client, created_todo):
         """Test that text and other fields remain unchanged after update."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
-        create_response = client.post(
-            "/api/todos/",
-            json={"text": "Original text"},
-            headers=self._get_auth_header(token)
-        )
-        todo = create_response.json()
-        todo_id = todo["id"]
-        
+        token, todo_id = created_todo
+
         # Update completion
         response = client.patch(
             f"/api/todos/{todo_id}",
             json={"completed": True},
             headers=self._get_auth_header(token)
         )
-        
+
         updated = response.json()
-        assert updated["text"] == "Original text"
+        assert updated["text"] == "Test todo"
         assert updated["id"] == todo_id
 
 
 class TestDeleteTodo(TestTodosEndpoints):
     """Tests for DELETE /api/todos/{id} endpoint (Issue #21)."""
 
-    def test_user_can_delete_own_todo(self, client):
+    def test_user_can_delete_own_todo(self, client, created_todo):
         """Test that user can delete their own todo."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
-        # Create a todo
-        create_response = client.post(
-            "/api/todos/",
-            json={"text": "To be deleted"},
-            headers=self._get_auth_header(token)
-        )
-        todo_id = create_response.json()["id"]
-        
-        # Delete it
+        token, todo_id = created_todo
+
         response = client.delete(
             f"/api/todos/{todo_id}",
             headers=self._get_auth_header(token)
         )
-        
+
         assert response.status_code == 204
 
-    def test_deleted_todo_is_removed_from_database(self, client, db_session):
+    def test_deleted_todo_is_removed_from_database(self, client, db_session, created_todo):
         """Test that deleted todo is removed from database."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
-        # Create a todo
-        create_response = client.post(
-            "/api/todos/",
-            json={"text": "To be deleted"},
-            headers=self._get_auth_header(token)
-        )
-        todo_id = create_response.json()["id"]
-        
-        # Delete it
+        token, todo_id = created_todo
+
         client.delete(
             f"/api/todos/{todo_id}",
             headers=self._get_auth_header(token)
         )
-        
+
         # Verify it's gone from database
         todo = db_session.query(TodoItem).filter(TodoItem.id == todo_id).first()
         assert todo is None
 
-    def test_subsequent_get_returns_404(self, client):
+    def test_subsequent_get_returns_404(self, client, created_todo):
         """Test that subsequent GET request for deleted todo returns 404."""
-        login_data = self._register_and_login(client)
-        token = login_data["access_token"]
-        
-        # Create a todo
-        create_response = client.post(
-            "/api/todos/",
-            json={"text": "To be deleted"},
-            headers=self._get_auth_header(token)
-        )
-        todo_id = create_response.json()["id"]
-        
-        # Delete it
+        token, todo_id = created_todo
+
         client.delete(
             f"/api/todos/{todo_id}",
             headers=self._get_auth_header(token)
         )
-        
+
         # Try to update deleted todo
         response = client.patch(
             f"/api/todos/{todo_id}",
             json={"completed": True},
             headers=self._get_auth_header(token)
         )
-        
+
         assert response.status_code == 404
 
     def test_404_for_nonexistent_todo(self, client):
@@ -530,7 +540,7 @@ class TestDeleteTodo(TestTodosEndpoints):
             headers=self._get_auth_header(token)
         )
         
-        data = response.json()
+        data = response.json()["items"]
         assert len(data) == 2
         remaining_ids = [t["id"] for t in data]
         assert todo_ids[0] in remaining_ids
@@ -18,7 +18,7 @@ export function TodoList() {
       setLoading(true);
       setError('');
       const data = await getAllTodos();
-      setTodos(data);
+      setTodos(data.items);
     } catch (err) {
       console.error('Failed to fetch todos:', err);
       setError('Failed to load your to-do items. Please try again.');
@@ -1,11 +1,14 @@
 import api from './api';
 
 /**
- * Get all todos for the authenticated user.
+ * Get todos for the authenticated user (keyset-paginated).
  * Returns todos in reverse chronological order (newest first).
+ * @param {Object} [options]
+ * @param {number} [options.limit] - Page size (default 50, max 200)
+ * @param {number} [options.cursor] - Id of the last item from the previous page
  */
-export const getAllTodos = async () => {
-  const response = await api.get('/api/todos');
+export const getAllTodos = async ({ limit, cursor } = {}) => {
+  const response = await api.get('/api/todos', { params: { limit, cursor } });
   return response.data;
 };
 
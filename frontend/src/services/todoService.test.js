@@ -10,17 +10,22 @@ describe('todoService', () => {
   });
 
   describe('getAllTodos', () => {
-    it('should fetch all todos', async () => {
-      const mockTodos = [
-        { id: 1, text: 'Test todo 1', completed: false },
-        { id: 2, text: 'Test todo 2', completed: true },
-      ];
-      api.get.mockResolvedValue({ data: mockTodos });
+    it('should fetch a page of todos', async () => {
+      const mockPage = {
+        items: [
+          { id: 1, text: 'Test todo 1', completed: false },
+          { id: 2, text: 'Test todo 2', completed: true },
+        ],
+        next_cursor: null,
+      };
+      api.get.mockResolvedValue({ data: mockPage });
 
       const result = await getAllTodos();
 
-      expect(api.get).toHaveBeenCalledWith('/api/todos');
-      expect(result).toEqual(mockTodos);
+      expect(api.get).toHaveBeenCalledWith('/api/todos', {
+        params: { limit: undefined, cursor: undefined },
+      });
+      expect(result).toEqual(mockPage);
     });
 
     it('should throw error on API failure', async () => {